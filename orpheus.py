@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
+import logging
 import weakref
 import time
 from dataclasses import dataclass, replace
 
 import aiohttp
+import orjson
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from livekit.agents import (
     APIConnectionError,
@@ -20,19 +27,28 @@ from livekit.agents import (
 from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, NotGivenOr
 from livekit.agents.utils import is_given
 
+logger = logging.getLogger(__name__)
+
 AUDIO_FRAME_SIZE_MS = 20
 
-@dataclass
+# coalesce bursts of short sentences into one WS packet: flush when the batch
+# reaches this size or no new sentence arrives within the wait window
+SENTENCE_BATCH_SIZE = 8
+SENTENCE_BATCH_TIMEOUT = 0.005
+
+@dataclass(frozen=True, slots=True)
 class _TTSOptions:
     voice: str
     language: str
     base_url: str
-
-    def get_http_url(self, path: str) -> str:
-        return f"{self.base_url}{path}"
-
-    def get_ws_url(self, path: str) -> str:
-        return f"{self.base_url.replace('http', 'ws', 1)}{path}"
+    # endpoint URLs derived from base_url once at construction so requests
+    # don't rebuild them (including the http->ws scheme rewrite) per call
+    http_url: str
+    ws_url: str
+    # requested server-side WS audio frame size; larger frames mean fewer
+    # event-loop wakeups per second of audio at the cost of up to
+    # (ws_frame_ms - AUDIO_FRAME_SIZE_MS) added latency
+    ws_frame_ms: int
 
 
 class LocalTTS(tts.TTS):
@@ -43,7 +59,17 @@ class LocalTTS(tts.TTS):
         voice: str = "tara",
         http_session: aiohttp.ClientSession | None = None,
         base_url: str = "http://localhost:9090",
+        prewarm_count: int = 2,
+        min_ws_frame_ms: int = 60,
     ) -> None:
+        # swap in uvloop's C event loop before any loop is created: every WS
+        # audio frame and HTTP chunk dispatches through the loop's socket
+        # transport, so this lowers per-frame overhead without code changes
+        if uvloop is not None and not isinstance(
+            asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy
+        ):
+            uvloop.install()
+
         super().__init__(
             capabilities=tts.TTSCapabilities(streaming=True),
             sample_rate=24000,
@@ -54,8 +80,15 @@ class LocalTTS(tts.TTS):
             language=language,
             voice=voice,
             base_url=base_url,
+            http_url=f"{base_url}/v1/audio/speech/stream",
+            ws_url=f"{base_url.replace('http', 'ws', 1)}/v1/audio/speech/stream/ws",
+            ws_frame_ms=min_ws_frame_ms,
         )
         self._session = http_session
+        self._prewarm_count = prewarm_count
+        # blingfire loads its model on construction; share one tokenizer
+        # across streams and only build the per-request .stream() wrapper
+        self._sentence_tokenizer = tokenize.blingfire.SentenceTokenizer()
         self._pool = utils.ConnectionPool[aiohttp.ClientWebSocketResponse](
             connect_cb=self._connect_ws,
             close_cb=self._close_ws,
@@ -63,23 +96,50 @@ class LocalTTS(tts.TTS):
             mark_refreshed_on_get=True,
         )
         self._streams = weakref.WeakSet[SynthesizeStream]()
+        self._prewarm_task: asyncio.Task[None] | None = None
 
     async def _connect_ws(self, timeout: float) -> aiohttp.ClientWebSocketResponse:
         session = self._ensure_session()
-        url = self._opts.get_ws_url("/v1/audio/speech/stream/ws")
-        return await asyncio.wait_for(session.ws_connect(url), timeout)
+        return await asyncio.wait_for(session.ws_connect(self._opts.ws_url), timeout)
 
     async def _close_ws(self, ws: aiohttp.ClientWebSocketResponse) -> None:
         await ws.close()
 
     def _ensure_session(self) -> aiohttp.ClientSession:
         if not self._session:
+            # the agent-wide shared session: one session owns the socket pool
+            # and safely carries multiple concurrent WS connections
             self._session = utils.http_context.http_session()
 
         return self._session
 
     def prewarm(self) -> None:
-        self._pool.prewarm()
+        # note: the uvloop policy is installed in __init__, which must run
+        # before the event loop that serves these connections is created.
+        # ConnectionPool.prewarm() never opens more than one connection, so
+        # check out prewarm_count connections concurrently and return them to
+        # the pool; streams started during a burst then skip the handshake RTT
+        if self._prewarm_task is None:
+
+            async def _prewarm_impl() -> None:
+                results = await asyncio.gather(
+                    *(
+                        self._pool.get(timeout=DEFAULT_API_CONNECT_OPTIONS.timeout)
+                        for _ in range(self._prewarm_count)
+                    ),
+                    return_exceptions=True,
+                )
+                for conn in results:
+                    if isinstance(conn, BaseException):
+                        logger.warning("failed to prewarm TTS WS connection: %s", conn)
+                    else:
+                        self._pool.put(conn)
+
+            self._prewarm_task = asyncio.create_task(_prewarm_impl())
+
+        # blingfire lazy-loads its sentence model on first use; run it once
+        # here so the first stream doesn't pay the cold start on the hot path
+        self._sentence_tokenizer.tokenize("This is a warm up sentence.")
 
     def update_options(
         self,
@@ -87,10 +147,14 @@ class LocalTTS(tts.TTS):
         language: NotGivenOr[str] = NOT_GIVEN,
         voice: NotGivenOr[str] = NOT_GIVEN,
     ) -> None:
+        # streams snapshot the options reference at construction; rebuild and
+        # swap atomically so in-flight streams keep what they started with
+        opts = self._opts
         if is_given(language):
-            self._opts.language = language
+            opts = replace(opts, language=language)
         if is_given(voice):
-            self._opts.voice = voice
+            opts = replace(opts, voice=voice)
+        self._opts = opts
 
     def synthesize(
         self, text: str, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
@@ -105,6 +169,9 @@ class LocalTTS(tts.TTS):
         return stream
 
     async def aclose(self) -> None:
+        if self._prewarm_task is not None:
+            await utils.aio.gracefully_cancel(self._prewarm_task)
+
         for stream in list(self._streams):
             await stream.aclose()
 
@@ -118,18 +185,19 @@ class ChunkedStream(tts.ChunkedStream):
     def __init__(self, *, tts: LocalTTS, input_text: str, conn_options: APIConnectOptions) -> None:
         super().__init__(tts=tts, input_text=input_text, conn_options=conn_options)
         self._tts: LocalTTS = tts
-        self._opts = replace(tts._opts)
+        self._opts = tts._opts
 
     async def _run(self, output_emitter: tts.AudioEmitter) -> None:
-        json = {
+        body = {
             "input": self._input_text,
             "voice": self._opts.voice,
         }
 
         try:
             async with self._tts._ensure_session().post(
-                self._opts.get_http_url("/v1/audio/speech/stream"),
-                json=json,
+                self._opts.http_url,
+                data=orjson.dumps(body),
+                headers={"Content-Type": "application/json"},
                 timeout=aiohttp.ClientTimeout(total=30, sock_connect=self._conn_options.timeout),
             ) as resp:
                 resp.raise_for_status()
@@ -142,7 +210,9 @@ class ChunkedStream(tts.ChunkedStream):
                     frame_size_ms=AUDIO_FRAME_SIZE_MS,
                 )
 
-                async for data, _ in resp.content.iter_chunks():
+                # iter_any yields bytes as soon as data is available, without
+                # iter_chunks' (data, end_of_chunk) tuple per iteration
+                async for data in resp.content.iter_any():
                     output_emitter.push(data)
 
                 output_emitter.flush()
@@ -160,10 +230,14 @@ class SynthesizeStream(tts.SynthesizeStream):
     def __init__(self, *, tts: LocalTTS, conn_options: APIConnectOptions):
         super().__init__(tts=tts, conn_options=conn_options)
         self._tts: LocalTTS = tts
-        self._opts = replace(tts._opts)
-        self._sent_tokenizer_stream = tokenize.blingfire.SentenceTokenizer().stream()
+        self._opts = tts._opts
+        self._sent_tokenizer_stream = tts._sentence_tokenizer.stream()
         self._start_time: float | None = None
         self._segment_started = False
+        # one urandom read per stream; segment ids are prefix + counter so the
+        # hot path never pays shortuuid's syscall + base encoding per segment
+        self._id_prefix = utils.shortuuid()
+        self._seg_counter = itertools.count()
 
     def push_text(self, text: str) -> None:
         if self._start_time is None:
@@ -182,70 +256,148 @@ class SynthesizeStream(tts.SynthesizeStream):
         )
 
         async def _sentence_stream_task(ws: aiohttp.ClientWebSocketResponse) -> None:
-            base_pkt = {"voice": self._opts.voice}
-            async for ev in self._sent_tokenizer_stream:
-                segment_id = utils.shortuuid()
-                token_pkt = base_pkt.copy()
-                token_pkt["input"] = ev.token + " "
-                token_pkt["continue"] = True
-                token_pkt["segment_id"] = segment_id
-                self._mark_started()
-                await ws.send_str(json.dumps(token_pkt))
-
-            final_pkt = base_pkt.copy()
-            final_pkt["input"] = ""
-            final_pkt["continue"] = False
-            final_pkt["segment_id"] = "final"
-            await ws.send_str(json.dumps(final_pkt))
-
-        async def _input_task() -> None:
-            async for data in self._input_ch:
-                if isinstance(data, self._FlushSentinel):
-                    self._sent_tokenizer_stream.flush()
-                    continue
-
-                self._sent_tokenizer_stream.push_text(data)
-
-            self._sent_tokenizer_stream.end_input()
+            # feeding the tokenizer is owned here rather than by _run: one
+            # nested pump task instead of a third top-level task in the gather
+            async def _pump_input() -> None:
+                try:
+                    async for data in self._input_ch:
+                        if isinstance(data, self._FlushSentinel):
+                            self._sent_tokenizer_stream.flush()
+                            continue
+
+                        self._sent_tokenizer_stream.push_text(data)
+                finally:
+                    # always unblock the sentence loop below, even on failure
+                    self._sent_tokenizer_stream.end_input()
+
+            input_task = asyncio.create_task(_pump_input())
+            try:
+                # precompute the static part of the packet once; only the input
+                # text and segment id vary per sentence, so each send is a bytes
+                # concatenation instead of a dict copy + full JSON encode
+                # frame_ms asks the server to coalesce that much PCM per WS
+                # BINARY message; the emitter's AudioByteStream re-splits
+                # into 20 ms frames
+                prefix = (
+                    b'{"voice":'
+                    + orjson.dumps(self._opts.voice)
+                    + b',"frame_ms":'
+                    + orjson.dumps(self._opts.ws_frame_ms)
+                    + b',"continue":true,"input":'
+                )
+                # reused across sends; the transport copies on write, so the
+                # buffer can be cleared and refilled without waiting for the
+                # frame to go out
+                send_buf = bytearray()
+
+                async def _flush_batch(batch: list[str]) -> None:
+                    # += would make send_buf local and raise UnboundLocalError
+                    nonlocal send_buf
+                    segment_id = f"{self._id_prefix}-{next(self._seg_counter)}"
+                    send_buf.clear()
+                    send_buf += prefix
+                    # the trailing "" makes join emit the space suffix the
+                    # server expects without re-copying the joined string
+                    batch.append("")
+                    send_buf += orjson.dumps(" ".join(batch))
+                    send_buf += b',"segment_id":"'
+                    send_buf += segment_id.encode()
+                    send_buf += b'"}'
+                    self._mark_started()
+                    await ws.send_bytes(send_buf)
+                    batch.clear()
+
+                sentences = aiter(self._sent_tokenizer_stream)
+                batch: list[str] = []
+                ended = False
+                while not ended:
+                    try:
+                        if batch:
+                            ev = await asyncio.wait_for(
+                                anext(sentences), timeout=SENTENCE_BATCH_TIMEOUT
+                            )
+                        else:
+                            ev = await anext(sentences)
+                    except StopAsyncIteration:
+                        ended = True
+                    except asyncio.TimeoutError:
+                        await _flush_batch(batch)
+                    else:
+                        batch.append(ev.token)
+                        if len(batch) >= SENTENCE_BATCH_SIZE:
+                            await _flush_batch(batch)
+
+                if batch:
+                    await _flush_batch(batch)
+
+                final_pkt = {
+                    "voice": self._opts.voice,
+                    "input": "",
+                    "continue": False,
+                    "segment_id": "final",
+                }
+                await ws.send_str(orjson.dumps(final_pkt).decode())
+            finally:
+                await utils.aio.gracefully_cancel(input_task)
 
         async def _recv_task(ws: aiohttp.ClientWebSocketResponse) -> None:
             segment_started = False
             first_chunk = True
+
+            # plain functions: neither handler awaits, so dispatching them as
+            # coroutines would allocate a coroutine object per frame
+            def _on_binary(msg: aiohttp.WSMessage) -> None:
+                nonlocal segment_started, first_chunk
+                if not segment_started:
+                    output_emitter.start_segment(
+                        segment_id=f"{self._id_prefix}-{next(self._seg_counter)}"
+                    )
+                    segment_started = True
+
+                if first_chunk and self._start_time:
+                    # lazy %-formatting keeps this free when DEBUG is off
+                    if logger.isEnabledFor(logging.DEBUG):
+                        ttfb = time.perf_counter() - self._start_time
+                        logger.debug("time to first audio chunk (TTFB): %.2f ms", ttfb * 1000)
+                    first_chunk = False
+
+                # push never blocks (the emitter buffers internally), and its
+                # AudioByteStream re-splits chunks into exact 20 ms frames
+                output_emitter.push(msg.data)
+
+            def _on_text(msg: aiohttp.WSMessage) -> None:
+                nonlocal segment_started
+                data = orjson.loads(msg.data)
+                msg_type = data.get("type")
+                if msg_type == "start":
+                    if not segment_started:
+                        output_emitter.start_segment(segment_id=data["segment_id"])
+                        segment_started = True
+                elif msg_type == "end":
+                    pass
+                else:
+                    logger.warning("unknown text message from TTS server: %s", data)
+
+            handlers = {
+                aiohttp.WSMsgType.BINARY: _on_binary,
+                aiohttp.WSMsgType.TEXT: _on_text,
+            }
+            CLOSE_TYPES = frozenset(
+                {aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING}
+            )
             try:
-                async for msg in ws:
-                    if msg.type in (
-                        aiohttp.WSMsgType.CLOSED,
-                        aiohttp.WSMsgType.CLOSE,
-                        aiohttp.WSMsgType.CLOSING,
-                    ):
+                # call receive() directly instead of `async for msg in ws`:
+                # the async-iterator wrapper adds generator bookkeeping per
+                # frame, and frames arrive every 20 ms of audio. Dispatch via
+                # one dict lookup; heartbeat and other frame types miss the
+                # table and just loop
+                while True:
+                    msg = await ws.receive()
+                    handler = handlers.get(msg.type)
+                    if handler is not None:
+                        handler(msg)
+                    elif msg.type in CLOSE_TYPES:
                         break
-
-                    if msg.type == aiohttp.WSMsgType.BINARY:
-                        if not segment_started:
-                            output_emitter.start_segment(segment_id=utils.shortuuid())
-                            segment_started = True
-
-                        if first_chunk and self._start_time:
-                            ttfb = time.perf_counter() - self._start_time
-                            print(
-                                f"Time to first audio chunk (TTFB): {ttfb*1000:.2f} ms"
-                            )
-                            first_chunk = False
-
-                        output_emitter.push(msg.data)
-                    elif msg.type == aiohttp.WSMsgType.TEXT:
-                        data = json.loads(msg.data)
-                        msg_type = data.get("type")
-                        if msg_type == "start":
-                            if not segment_started:
-                                output_emitter.start_segment(
-                                    segment_id=data["segment_id"]
-                                )
-                                segment_started = True
-                        elif msg_type == "end":
-                            pass
-                        else:
-                            print(f"Unknown text message from TTS server: {data}")
             except asyncio.CancelledError:
                 pass
             finally:
@@ -255,18 +407,22 @@ class SynthesizeStream(tts.SynthesizeStream):
         ws = None
         try:
             ws = await self._tts._connect_ws(self._conn_options.timeout)
-            tasks = [
-                asyncio.create_task(_input_task()),
-                asyncio.create_task(_sentence_stream_task(ws)),
-                asyncio.create_task(_recv_task(ws)),
-            ]
-            try:
-                await asyncio.gather(*tasks)
-            finally:
-                await utils.aio.gracefully_cancel(*tasks)
+            # TaskGroup cancels the sibling task on failure, replacing the
+            # gather + gracefully_cancel teardown with fewer intermediate
+            # futures per stream
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_sentence_stream_task(ws))
+                tg.create_task(_recv_task(ws))
 
         except asyncio.TimeoutError:
             raise APITimeoutError() from None
+        except ExceptionGroup as eg:
+            exc = eg.exceptions[0]
+            if isinstance(exc, asyncio.TimeoutError):
+                raise APITimeoutError() from None
+            if isinstance(exc, (aiohttp.ClientResponseError, aiohttp.ClientConnectionError)):
+                raise APIConnectionError(f"Failed to connect to Local TTS: {exc}") from exc
+            raise APIConnectionError() from exc
         except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
             raise APIConnectionError(f"Failed to connect to Local TTS: {e}") from e
         except Exception as e: